@@ -3,8 +3,17 @@
 
 const CACHE_TTL = 3600; // Cache for 1 hour (seconds)
 
+// Records when a response in the edge cache was fetched from YouTube
+const FETCHED_AT_HEADER = "X-Fetched-At";
+
+// Pattern: "M:SS - M:SS" or "H:MM:SS - H:MM:SS"
+const RANGE_PATTERN = /^(\d+:\d{1,2}(?::\d{1,2})?)\s*-\s*(\d+:\d{1,2}(?::\d{1,2})?)$/;
+
+// Pattern: "M:SS" or "H:MM:SS" (hours group is optional)
+const TIMESTAMP_PATTERN = /^(?:(\d+):)?(\d+):(\d{1,2})$/;
+
 export default {
-  async fetch(request, env) {
+  async fetch(request, env, ctx) {
     // Handle CORS preflight
     if (request.method === "OPTIONS") {
       return handleCORS();
@@ -22,12 +31,23 @@ export default {
       return jsonResponse({ error: "Invalid video ID" }, 400);
     }
 
+    // Edge cache key, used when KV is not configured (the edge cache only
+    // works on a custom domain or route, not on *.workers.dev)
+    const cacheKey = new Request(`${url.origin}${url.pathname}?v=${videoId}`);
+    const useEdgeCache = !env.YT_CACHE && !url.hostname.endsWith(".workers.dev");
+
     try {
-      // Check cache first (if KV is configured)
+      // Check cache first (KV if configured, otherwise the edge cache)
       if (env.YT_CACHE) {
-        const cached = await env.YT_CACHE.get(videoId, "json");
+        const { value, metadata } = await env.YT_CACHE.getWithMetadata(videoId, "json");
+        if (value) {
+          return jsonResponse(value, 200, cacheHeaders(metadata?.fetchedAt));
+        }
+      } else if (useEdgeCache) {
+        const cached = await caches.default.match(cacheKey);
         if (cached) {
-          return jsonResponse(cached);
+          const fetchedAt = Number(cached.headers.get(FETCHED_AT_HEADER));
+          return jsonResponse(await cached.json(), 200, cacheHeaders(fetchedAt));
         }
       }
 
@@ -61,14 +81,29 @@ export default {
         publishedAt: snippet.publishedAt,
       };
 
-      // Cache the result (if KV is configured)
+      const fetchedAt = Date.now();
+
+      // Cache the result in the background (KV if configured, otherwise the
+      // edge cache where available)
       if (env.YT_CACHE) {
-        await env.YT_CACHE.put(videoId, JSON.stringify(result), {
-          expirationTtl: CACHE_TTL,
+        ctx.waitUntil(
+          env.YT_CACHE.put(videoId, JSON.stringify(result), {
+            expirationTtl: CACHE_TTL,
+            metadata: { fetchedAt },
+          })
+        );
+      } else if (useEdgeCache) {
+        const cachedResponse = jsonResponse(result, 200, {
+          ...cacheHeaders(fetchedAt),
+          [FETCHED_AT_HEADER]: String(fetchedAt),
         });
+        ctx.waitUntil(caches.default.put(cacheKey, cachedResponse));
       }
 
-      return jsonResponse(result);
+      // Only let browsers cache what the Worker itself caches, so an edited
+      // description shows up on the next reload when nothing is cached
+      const isCached = env.YT_CACHE || useEdgeCache;
+      return jsonResponse(result, 200, isCached ? cacheHeaders(fetchedAt) : {});
     } catch (err) {
       return jsonResponse({ error: "Internal error", message: err.message }, 500);
     }
@@ -83,9 +118,6 @@ function parseHighlightsFromDescription(description) {
   const highlights = [];
   let inSection = false;
 
-  // Pattern: "M:SS - M:SS" or "H:MM:SS - H:MM:SS"
-  const rangePattern = /^(\d+:\d{1,2}(?::\d{1,2})?)\s*-\s*(\d+:\d{1,2}(?::\d{1,2})?)$/;
-
   for (const line of lines) {
     const stripped = line.trim();
 
@@ -101,7 +133,7 @@ function parseHighlightsFromDescription(description) {
       break;
     }
 
-    const match = stripped.match(rangePattern);
+    const match = stripped.match(RANGE_PATTERN);
     if (match) {
       const startTime = parseTimestamp(match[1]);
       const endTime = parseTimestamp(match[2]);
@@ -116,19 +148,22 @@ function parseHighlightsFromDescription(description) {
 
 // Parse timestamp string to seconds
 function parseTimestamp(ts) {
-  const parts = ts.trim().split(":");
-  if (parts.length === 2) {
-    // M:SS
-    return parseInt(parts[0]) * 60 + parseInt(parts[1]);
-  } else if (parts.length === 3) {
-    // H:MM:SS
-    return parseInt(parts[0]) * 3600 + parseInt(parts[1]) * 60 + parseInt(parts[2]);
-  }
-  return null;
+  const match = TIMESTAMP_PATTERN.exec(ts.trim());
+  if (!match) return null;
+  const hours = match[1] ? parseInt(match[1]) : 0;
+  return hours * 3600 + parseInt(match[2]) * 60 + parseInt(match[3]);
+}
+
+// Cache-Control for a response fetched at fetchedAt (ms), so browsers reuse it
+// only until the Worker's cached copy expires
+function cacheHeaders(fetchedAt) {
+  if (!fetchedAt) return {};
+  const remaining = CACHE_TTL - Math.floor((Date.now() - fetchedAt) / 1000);
+  return { "Cache-Control": `public, max-age=${Math.max(0, remaining)}` };
 }
 
 // JSON response helper with CORS headers
-function jsonResponse(data, status = 200) {
+function jsonResponse(data, status = 200, headers = {}) {
   return new Response(JSON.stringify(data), {
     status,
     headers: {
@@ -136,6 +171,7 @@ function jsonResponse(data, status = 200) {
       "Access-Control-Allow-Origin": "*",
       "Access-Control-Allow-Methods": "GET, OPTIONS",
       "Access-Control-Allow-Headers": "Content-Type",
+      ...headers,
     },
   });
 }
@@ -3,7 +3,7 @@ const youtubeVideoId = new URLSearchParams(window.location.search).get('v');
 let videoDuration = 0;
 
 // ============= State =============
-let highlights = []; // client-side highlight objects
+let highlights = []; // client-side highlight objects, kept sorted by start_time
 let selectedHighlightId = null;
 let recordingStart = null;
 let mode = 'watch';
@@ -105,12 +105,12 @@ async function loadVideoData(videoId) {
             duration: h.end_time - h.start_time,
             source: 'description',
             label: null,
-        }));
+        })).sort((a, b) => a.start_time - b.start_time);
 
         // Check for a saved draft
         const draft = loadDraft();
         if (draft) {
-            highlights = draft.highlights;
+            highlights = draft.highlights.sort((a, b) => a.start_time - b.start_time);
             highlightCounter = draft.highlightCounter;
             originalHighlights = apiHighlights.map(h => ({ ...h }));
             mode = 'edit';
@@ -283,7 +283,8 @@ function togglePlayAll() {
 function startPlayAll() {
     if (highlights.length === 0) return;
 
-    playAllClips = [...highlights].sort((a, b) => a.start_time - b.start_time);
+    // Snapshot the (already start-sorted) list so edits don't shift playback
+    playAllClips = [...highlights];
     playAllClipIndex = 0;
     isPlayingAll = true;
 
@@ -367,16 +368,11 @@ function onPlayAllTimeUpdate() {
 
 // ============= Export =============
 function buildDescriptionText() {
-    const sorted = [...highlights].sort((a, b) => a.start_time - b.start_time);
     const watchUrl = `https://popcornylu.github.io/yt-hlite/watch.html?v=${youtubeVideoId}`;
 
-    let lines = [watchUrl, '', '[Highlights]'];
-    for (const h of sorted) {
-        const start = formatTimestampForDescription(h.start_time);
-        const end = formatTimestampForDescription(h.end_time);
-        lines.push(`${start} - ${end}`);
-    }
-    return lines.join('\n');
+    const ranges = highlights.map(h =>
+        `${formatTimestampForDescription(h.start_time)} - ${formatTimestampForDescription(h.end_time)}`);
+    return [watchUrl, '', '[Highlights]', ...ranges].join('\n');
 }
 
 function openExportModal() {
@@ -419,12 +415,13 @@ function togglePreview(checked) {
 function formatTimestampForDescription(seconds) {
     const totalSecs = Math.round(seconds);
     const hours = Math.floor(totalSecs / 3600);
-    const minutes = Math.floor((totalSecs % 3600) / 60);
-    const secs = totalSecs % 60;
+    const rem = totalSecs - hours * 3600;
+    const minutes = Math.floor(rem / 60);
+    const secs = rem - minutes * 60;
     if (hours > 0) {
-        return `${hours}:${minutes.toString().padStart(2, '0')}:${secs.toString().padStart(2, '0')}`;
+        return `${hours}:${TWO_DIGITS[minutes]}:${TWO_DIGITS[secs]}`;
     }
-    return `${minutes}:${secs.toString().padStart(2, '0')}`;
+    return `${minutes}:${TWO_DIGITS[secs]}`;
 }
 
 // ============= Splitter =============
@@ -852,8 +849,8 @@ function createHighlight(start, end) {
         label: null,
     };
 
-    highlights.push(highlight);
-    highlights.sort((a, b) => a.start_time - b.start_time);
+    // Insert at its sorted position instead of re-sorting the whole list
+    highlights.splice(searchHighlightStart(start), 0, highlight);
 
     selectedHighlightId = highlight.id;
     showToast('Highlight added');
@@ -866,9 +863,12 @@ function createHighlight(start, end) {
 function updateHighlight(id, updates) {
     const index = highlights.findIndex(h => h.id === id);
     if (index >= 0) {
-        Object.assign(highlights[index], updates);
-        highlights[index].duration = highlights[index].end_time - highlights[index].start_time;
-        highlights.sort((a, b) => a.start_time - b.start_time);
+        const highlight = highlights[index];
+        Object.assign(highlight, updates);
+        highlight.duration = highlight.end_time - highlight.start_time;
+        // Move it to its (possibly new) sorted position
+        highlights.splice(index, 1);
+        highlights.splice(searchHighlightStart(highlight.start_time), 0, highlight);
     }
 
     renderHighlights();
@@ -914,31 +914,33 @@ function deselectHighlight() {
     renderTimeline();
 }
 
+// Binary search over highlights (kept sorted by start_time). Returns the index of
+// the first highlight starting after `time`, or at/after it when `inclusive` is set.
+function searchHighlightStart(time, inclusive = false) {
+    let lo = 0;
+    let hi = highlights.length;
+    while (lo < hi) {
+        const mid = (lo + hi) >> 1;
+        const start = highlights[mid].start_time;
+        if (start < time || (!inclusive && start === time)) lo = mid + 1;
+        else hi = mid;
+    }
+    return lo;
+}
+
 function jumpToPrevHighlight() {
     if (highlights.length === 0) return;
     const currentTime = VideoPlayer.getCurrentTime();
-    let prev = null;
-    for (let i = highlights.length - 1; i >= 0; i--) {
-        if (highlights[i].start_time < currentTime - 0.5) {
-            prev = highlights[i];
-            break;
-        }
-    }
-    if (prev) selectHighlight(prev.id);
+    const index = searchHighlightStart(currentTime - 0.5, true) - 1;
+    if (index >= 0) selectHighlight(highlights[index].id);
     else selectHighlight(highlights[highlights.length - 1].id);
 }
 
 function jumpToNextHighlight() {
     if (highlights.length === 0) return;
     const currentTime = VideoPlayer.getCurrentTime();
-    let next = null;
-    for (const h of highlights) {
-        if (h.start_time > currentTime + 0.5) {
-            next = h;
-            break;
-        }
-    }
-    if (next) selectHighlight(next.id);
+    const index = searchHighlightStart(currentTime + 0.5);
+    if (index < highlights.length) selectHighlight(highlights[index].id);
     else selectHighlight(highlights[0].id);
 }
 
@@ -1131,6 +1133,9 @@ function updateStats() {
 }
 
 // ============= Time Formatting =============
+// Zero-padded "00".."59" lookup for the minutes/seconds fields
+const TWO_DIGITS = Array.from({ length: 60 }, (_, i) => i.toString().padStart(2, '0'));
+
 function formatTimePrecise(seconds) {
     if (seconds === undefined || seconds === null || isNaN(seconds)) return '00:00.00';
     const mins = Math.floor(seconds / 60);
@@ -1140,9 +1145,10 @@ function formatTimePrecise(seconds) {
 
 function formatTimeShort(seconds) {
     if (seconds === undefined || seconds === null || isNaN(seconds)) return '0:00';
-    const mins = Math.floor(seconds / 60);
-    const secs = Math.floor(seconds % 60);
-    return `${mins}:${secs.toString().padStart(2, '0')}`;
+    const totalSecs = Math.floor(seconds);
+    const mins = Math.floor(totalSecs / 60);
+    const secs = totalSecs - mins * 60;
+    return `${mins}:${TWO_DIGITS[secs]}`;
 }
 
 // ============= Mobile Detection =============
@@ -1190,14 +1196,13 @@ function setupFullscreen() {
         if (!isFullscreen || highlights.length === 0) return;
         const rect = progressBar.getBoundingClientRect();
         const pct = Math.max(0, Math.min(1, (e.clientX - rect.left) / rect.width));
-        const sorted = [...highlights].sort((a, b) => a.start_time - b.start_time);
-        const totalDur = sorted.reduce((s, h) => s + (h.end_time - h.start_time), 0);
+        const totalDur = highlights.reduce((s, h) => s + (h.end_time - h.start_time), 0);
         const targetOffset = pct * totalDur;
         let accum = 0;
-        for (let i = 0; i < sorted.length; i++) {
-            const clipDur = sorted[i].end_time - sorted[i].start_time;
+        for (let i = 0; i < highlights.length; i++) {
+            const clipDur = highlights[i].end_time - highlights[i].start_time;
             if (accum + clipDur >= targetOffset) {
-                const seekTime = sorted[i].start_time + (targetOffset - accum);
+                const seekTime = highlights[i].start_time + (targetOffset - accum);
                 VideoPlayer.setCurrentTime(seekTime);
                 // If playing all, update the clip index
                 if (isPlayingAll) {
@@ -1286,8 +1291,6 @@ function updateFsOverlay() {
 
     if (!indicator || !progressFill || !timeDisplay) return;
 
-    const sorted = [...highlights].sort((a, b) => a.start_time - b.start_time);
-    const totalDur = sorted.reduce((s, h) => s + (h.end_time - h.start_time), 0);
     const currentTime = VideoPlayer.getCurrentTime();
 
     if (isPlayingAll && playAllClipIndex < playAllClips.length) {
@@ -1297,16 +1300,20 @@ function updateFsOverlay() {
         indicator.textContent = `${highlights.length} highlight${highlights.length !== 1 ? 's' : ''}`;
     }
 
-    // Progress: compute elapsed time across all clips up to current playback position
+    // Progress: total clip time and elapsed time across all clips up to the
+    // current playback position, in a single pass
+    let totalDur = 0;
     let elapsed = 0;
-    for (const h of sorted) {
+    let reached = false;
+    for (const h of highlights) {
+        const clipDur = h.end_time - h.start_time;
+        totalDur += clipDur;
+        if (reached) continue;
         if (currentTime >= h.end_time) {
-            elapsed += h.end_time - h.start_time;
-        } else if (currentTime >= h.start_time) {
-            elapsed += currentTime - h.start_time;
-            break;
+            elapsed += clipDur;
         } else {
-            break;
+            if (currentTime >= h.start_time) elapsed += currentTime - h.start_time;
+            reached = true;
         }
     }
     const pct = totalDur > 0 ? (elapsed / totalDur) * 100 : 0;